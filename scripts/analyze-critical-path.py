@@ -0,0 +1,273 @@
+"""
+Initial-load critical path from bundle/stats.json import metadata.
+
+Follows static imports from each entry (and from the lazily loaded module
+each route awaits before rendering) to separate the bytes needed before first
+render from bytes that are only fetched on demand. Modules are then ranked by
+how many initial bytes would leave the critical path if they were imported
+dynamically instead, which is what moves the FCP numbers in scripts/tachometer.
+
+Usage: python scripts/analyze-critical-path.py [bundle/stats.json] [--json out.json] [--top N]
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+from bundle_stats import DEFAULT_STATS, load_stats, module_graph, stable_chunk_name
+
+SIZE_KEYS = ("rendered", "gzip", "brotli")
+
+# Modules each route has to load (via React.lazy) before its content renders.
+# Matched as substrings of the module id; see src/App.tsx and src/routes.tsx.
+MARKDOWN_DIALOG = ("src/components/RoutedDialogs/RoutedDialogs", "src/components/AppDialog/Markdown/MarkdownContentRenderer")
+ROUTES = {
+    "/": (),
+    "/about/": MARKDOWN_DIALOG,
+    "/instructions/": MARKDOWN_DIALOG,
+    "/changelog/": MARKDOWN_DIALOG,
+    "/translation/": MARKDOWN_DIALOG,
+    "/privacy/": MARKDOWN_DIALOG,
+    "/userstats/": ("src/routes/UserStatsRoute",),
+    "/performance/": ("src/routes/PerformanceRoute",),
+}
+
+
+def static_closure(graph, roots):
+    """Return every module reachable from `roots` through static imports."""
+    seen = set()
+    stack = [uid for uid in roots if uid in graph]
+    while stack:
+        uid = stack.pop()
+        if uid in seen:
+            continue
+        seen.add(uid)
+        stack.extend(dep for dep in graph[uid]['static'] if dep in graph and dep not in seen)
+    return seen
+
+
+def loaded_chunks(graph, closure, seed=()):
+    """Return the chunks the browser fetches to have every module in `closure`.
+
+    Starts from `seed` (the entry or route chunks) and adds, for each module with
+    no copy in a loaded chunk yet, the chunk holding it. Modules that live in one
+    chunk are placed first, so a module duplicated into several chunks only pulls
+    in another chunk when none of its copies is already loaded.
+    """
+    loaded = set(seed)
+    for uid in sorted(closure, key=lambda u: (len(graph[u]['chunks']), graph[u]['id'])):
+        chunks = graph[uid]['chunks']
+        if chunks and not loaded.intersection(chunks):
+            loaded.add(chunks[0])
+    return loaded
+
+
+def copy_sizes(graph, uid, chunks):
+    """[rendered, gzip, brotli] of the copies of `uid` that live in `chunks`."""
+    sizes = [0, 0, 0]
+    for chunk, part in graph[uid]['parts'].items():
+        if chunk in chunks:
+            for i, size in enumerate(part):
+                sizes[i] += size
+    return sizes
+
+
+def total_sizes(graph, uids, chunks):
+    per_module = [copy_sizes(graph, uid, chunks) for uid in uids]
+    return [sum(s[i] for s in per_module) for i in range(3)]
+
+
+def chunk_sizes(graph):
+    """Return {chunk: [rendered, gzip, brotli]} from the module copies each chunk holds."""
+    sizes = defaultdict(lambda: [0, 0, 0])
+    for node in graph.values():
+        for chunk, part in node['parts'].items():
+            for i, size in enumerate(part):
+                sizes[chunk][i] += size
+    return sizes
+
+
+def dominators(graph, entries):
+    """Immediate dominators of the static import graph, rooted at a virtual node above all entries.
+
+    Cooper, Harvey & Kennedy, "A Simple, Fast Dominance Algorithm".
+    """
+    root = None
+    succs = lambda uid: entries if uid is root else [d for d in graph[uid]['static'] if d in graph]
+
+    # Iterative DFS for reverse postorder
+    order, seen = [], {root}
+    stack = [(root, iter(succs(root)))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            order.append(node)
+        elif child not in seen:
+            seen.add(child)
+            stack.append((child, iter(succs(child))))
+    order.reverse()
+    index = {uid: i for i, uid in enumerate(order)}
+
+    preds = defaultdict(list)
+    for uid in order:
+        for dep in succs(uid):
+            preds[dep].append(uid)
+
+    idom = {root: root}
+
+    def intersect(a, b):
+        while a != b:
+            while index[a] > index[b]:
+                a = idom[a]
+            while index[b] > index[a]:
+                b = idom[b]
+        return a
+
+    changed = True
+    while changed:
+        changed = False
+        for uid in order[1:]:
+            processed = [p for p in preds[uid] if p in idom]
+            new_idom = processed[0]
+            for p in processed[1:]:
+                new_idom = intersect(p, new_idom)
+            if uid not in idom or idom[uid] != new_idom:
+                idom[uid] = new_idom
+                changed = True
+    return idom
+
+
+def dynamic_import_candidates(graph, entries, initial, initial_chunks, top):
+    """Rank modules by the initial bytes that would be deferred if they were imported dynamically.
+
+    A module's savings are the bytes of everything it dominates: modules only
+    reachable from the entries through it. Only copies in the initial chunks count.
+    """
+    idom = dominators(graph, entries)
+    own = {uid: copy_sizes(graph, uid, initial_chunks) for uid in initial}
+    savings = {uid: list(own[uid]) for uid in initial}
+    # Accumulate subtree sizes bottom-up: deeper modules first
+    depth = {}
+    for uid in initial:
+        d, node = 0, uid
+        while node is not None:
+            node = idom[node]
+            d += 1
+        depth[uid] = d
+    for uid in sorted(initial, key=lambda u: depth[u], reverse=True):
+        parent = idom[uid]
+        if parent is not None:
+            for i in range(3):
+                savings[parent][i] += savings[uid][i]
+
+    importers = defaultdict(list)
+    for uid in initial:
+        for dep in graph[uid]['static']:
+            if dep in initial:
+                importers[dep].append(graph[uid]['id'])
+
+    candidates = [uid for uid in initial if uid not in entries]
+    candidates.sort(key=lambda uid: savings[uid][1], reverse=True)
+    return [{
+        'module': graph[uid]['id'],
+        'saves': dict(zip(SIZE_KEYS, savings[uid])),
+        'own': dict(zip(SIZE_KEYS, own[uid])),
+        'imported_by': sorted(importers[uid]),
+    } for uid in candidates[:top]]
+
+
+def analyze(data, routes=ROUTES, top=20):
+    graph = module_graph(data)
+    if not graph:
+        raise SystemExit("stats.json has no nodeMetas; rebuild with rollup-plugin-visualizer template 'raw-data'.")
+
+    entries = [uid for uid, node in graph.items() if node['is_entry']]
+    initial = static_closure(graph, entries)
+    lazy = set(graph) - initial
+    chunks = chunk_sizes(graph)
+    initial_chunks = loaded_chunks(graph, initial, {c for uid in entries for c in graph[uid]['chunks']})
+    lazy_chunks = set(chunks) - initial_chunks
+
+    route_reports = {}
+    for route, patterns in routes.items():
+        roots = [uid for uid, node in graph.items() if any(p in node['id'] for p in patterns)]
+        closure = static_closure(graph, entries + roots)
+        route_chunks = loaded_chunks(graph, closure, initial_chunks | {c for uid in roots for c in graph[uid]['chunks']})
+        route_reports[route] = {
+            'modules': len(closure),
+            'before_render': dict(zip(SIZE_KEYS, total_sizes(graph, closure, route_chunks))),
+            'route_only': dict(zip(SIZE_KEYS, total_sizes(graph, closure - initial, route_chunks))),
+            'chunks': [stable_chunk_name(c) for c in sorted(route_chunks)],
+            'chunk_bytes': dict(zip(SIZE_KEYS, (round(sum(chunks[c][i] for c in route_chunks)) for i in range(3)))),
+            'unmatched': [p for p in patterns if not any(p in graph[uid]['id'] for uid in roots)],
+        }
+
+    return {
+        'entries': [graph[uid]['id'] for uid in entries],
+        'initial': {
+            'modules': len(initial),
+            **dict(zip(SIZE_KEYS, total_sizes(graph, initial, initial_chunks))),
+            'chunks': [stable_chunk_name(c) for c in sorted(initial_chunks)],
+            # Whole chunks are downloaded, so this is what the browser actually fetches
+            'chunk_bytes': dict(zip(SIZE_KEYS, (round(sum(chunks[c][i] for c in initial_chunks)) for i in range(3)))),
+        },
+        # Everything in chunks outside the initial set, including extra copies of initial modules
+        'lazy': {'modules': len(lazy), **dict(zip(SIZE_KEYS, total_sizes(graph, graph, lazy_chunks)))},
+        'routes': route_reports,
+        'candidates': dynamic_import_candidates(graph, entries, initial, initial_chunks, top),
+    }
+
+
+def format_report(result):
+    kb = lambda b: f"{b / 1024:.2f} KB"
+    initial, lazy = result['initial'], result['lazy']
+    lines = [
+        f"Entries: {', '.join(result['entries'])}",
+        "",
+        f"Before first render: {initial['modules']} modules, {kb(initial['rendered'])} rendered, "
+        f"{kb(initial['gzip'])} gzip, {kb(initial['brotli'])} brotli",
+        f"  in {len(initial['chunks'])} chunk(s) totalling {kb(initial['chunk_bytes']['gzip'])} gzip: "
+        f"{', '.join(initial['chunks'])}",
+        f"Lazily loaded:       {lazy['modules']} modules, {kb(lazy['rendered'])} rendered, "
+        f"{kb(lazy['gzip'])} gzip, {kb(lazy['brotli'])} brotli",
+        "",
+        "Per route (gzip, before render / route-only / whole chunks):",
+    ]
+    for route, r in result['routes'].items():
+        note = f"  (no module matched: {', '.join(r['unmatched'])})" if r['unmatched'] else ""
+        lines.append(f"  {route:<16} {kb(r['before_render']['gzip']):>12} {kb(r['route_only']['gzip']):>12} "
+                     f"{kb(r['chunk_bytes']['gzip']):>12}{note}")
+    lines.append("")
+    lines.append("Top dynamic-import candidates (initial gzip bytes deferred):")
+    for c in result['candidates']:
+        lines.append(f"  {kb(c['saves']['gzip']):>12}  {c['module']}")
+        if c['imported_by']:
+            lines.append(f"                imported by {', '.join(c['imported_by'][:3])}"
+                         f"{' ...' if len(c['imported_by']) > 3 else ''}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report initial-load bytes and dynamic-import candidates from bundle/stats.json.")
+    parser.add_argument("stats", nargs="?", default=DEFAULT_STATS, help=f"Visualizer raw-data JSON (default: {DEFAULT_STATS}).")
+    parser.add_argument("--json", dest="json_out", help="Also write the report as JSON to this path ('-' for stdout only).")
+    parser.add_argument("--top", type=int, default=20, help="Number of dynamic-import candidates to list (default: 20).")
+    args = parser.parse_args()
+
+    result = analyze(load_stats(args.stats), top=args.top)
+
+    if args.json_out == "-":
+        print(json.dumps(result, indent=2))
+        return
+    print(format_report(result))
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"\nJSON report written to {args.json_out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Report node_modules packages that are bundled more than once.
+
+Two kinds of duplication inflate download size:
+  * the same module of a package@version rendered into several chunks
+  * several versions of the same package shipped side by side (each version
+    counted once per module, so extra copies are only cross-chunk waste)
+
+Usage: python scripts/analyze-duplicates.py [bundle/stats.json] [--json out.json] [--top N]
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+from bundle_stats import DEFAULT_STATS, iter_module_parts, load_stats, package_of, part_sizes, split_package
+
+
+def aggregate_packages(data, root="."):
+    """Return {package@version: {module_id: {chunk: [rendered, gzip, brotli]}}}."""
+    packages = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: [0, 0, 0])))
+    for chunk_name, module_id, part in iter_module_parts(data):
+        package = package_of(module_id, root)
+        if not package:
+            continue
+        totals = packages[package][module_id][chunk_name]
+        for i, size in enumerate(part_sizes(part)):
+            totals[i] += size
+    return packages
+
+
+def _sum_sizes(chunks):
+    return [sum(c[i] for c in chunks) for i in range(3)]
+
+
+def chunk_breakdown(modules):
+    """Return {chunk: [rendered, gzip, brotli, modules]} for one package's modules."""
+    chunks = defaultdict(lambda: [0, 0, 0, 0])
+    for copies in modules.values():
+        for chunk_name, sizes in copies.items():
+            for i, size in enumerate(sizes):
+                chunks[chunk_name][i] += size
+            chunks[chunk_name][3] += 1
+    return chunks
+
+
+def single_copy_sizes(modules):
+    """Package size counting each module once (its largest copy).
+
+    Extra copies are cross-chunk waste, so leaving them out keeps a version's
+    multi-version waste from counting them a second time.
+    """
+    return _sum_sizes([max(copies.values(), key=lambda c: c[0]) for copies in modules.values()])
+
+
+def find_duplicates(packages):
+    """Rank duplicated packages by wasted bytes (everything beyond the largest single copy)."""
+    duplicates = []
+
+    # Same module rendered into several chunks. Different modules of one package
+    # landing in different chunks is normal code splitting, not duplication.
+    for package, modules in packages.items():
+        wasted = [0, 0, 0]
+        duplicated = {}
+        for module_id, copies in modules.items():
+            if len(copies) < 2:
+                continue
+            total = _sum_sizes(copies.values())
+            largest = max(copies.values(), key=lambda c: c[0])
+            for i in range(3):
+                wasted[i] += total[i] - largest[i]
+            duplicated[module_id] = sorted(copies)
+        if not duplicated:
+            continue
+        chunks = chunk_breakdown(modules)
+        duplicates.append({
+            'kind': 'cross-chunk',
+            'package': package,
+            'modules': dict(sorted(duplicated.items())),
+            # Where the package's modules live; informational, only 'modules' above are duplicated
+            'chunks': {name: {'rendered': c[0], 'gzip': c[1], 'brotli': c[2], 'modules': c[3]}
+                       for name, c in sorted(chunks.items())},
+            'total': dict(zip(('rendered', 'gzip', 'brotli'), _sum_sizes(chunks.values()))),
+            'wasted': dict(zip(('rendered', 'gzip', 'brotli'), wasted)),
+        })
+
+    # Several versions of the same package
+    by_name = defaultdict(dict)
+    for package, modules in packages.items():
+        name, version = split_package(package)
+        by_name[name][version] = single_copy_sizes(modules)
+    for name, versions in by_name.items():
+        if len(versions) < 2:
+            continue
+        total = _sum_sizes(versions.values())
+        largest = max(versions.values(), key=lambda v: v[0])
+        duplicates.append({
+            'kind': 'multi-version',
+            'package': name,
+            'versions': {version: {'rendered': v[0], 'gzip': v[1], 'brotli': v[2],
+                                   'chunks': sorted(chunk_breakdown(packages[f"{name}@{version}"]))}
+                         for version, v in sorted(versions.items())},
+            'total': dict(zip(('rendered', 'gzip', 'brotli'), total)),
+            'wasted': {'rendered': total[0] - largest[0], 'gzip': total[1] - largest[1],
+                       'brotli': total[2] - largest[2]},
+        })
+
+    duplicates.sort(key=lambda d: (d['wasted']['gzip'], d['wasted']['rendered']), reverse=True)
+    return duplicates
+
+
+def format_report(duplicates, top=None):
+    kb = lambda b: f"{b / 1024:.2f} KB"
+    lines = []
+    wasted = {k: sum(d['wasted'][k] for d in duplicates) for k in ('rendered', 'gzip', 'brotli')}
+    lines.append(f"{len(duplicates)} duplicated package(s), wasting "
+                  f"{kb(wasted['rendered'])} rendered / {kb(wasted['gzip'])} gzip / {kb(wasted['brotli'])} brotli")
+    for kind in ('cross-chunk', 'multi-version'):
+        entries = [d for d in duplicates if d['kind'] == kind]
+        lines.append(f"    {kind:<14} {len(entries):>3} package(s), "
+                     f"{kb(sum(d['wasted']['rendered'] for d in entries))} rendered / "
+                     f"{kb(sum(d['wasted']['gzip'] for d in entries))} gzip")
+
+    for d in duplicates[:top]:
+        w = d['wasted']
+        lines.append("")
+        lines.append(f"[{d['kind']}] {d['package']}  wasted {kb(w['rendered'])} rendered, "
+                     f"{kb(w['gzip'])} gzip, {kb(w['brotli'])} brotli")
+        if d['kind'] == 'cross-chunk':
+            for module_id, chunks in d['modules'].items():
+                lines.append(f"    {module_id}  in {', '.join(chunks)}")
+            lines.append("    package by chunk:")
+            for name, c in d['chunks'].items():
+                lines.append(f"      {name:<48} {kb(c['rendered']):>12} {kb(c['gzip']):>12} ({c['modules']} modules)")
+        else:
+            for version, v in d['versions'].items():
+                lines.append(f"    {version:<20} {kb(v['rendered']):>12} {kb(v['gzip']):>12}  in {', '.join(v['chunks'])}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report duplicated node_modules packages in bundle/stats.json.")
+    parser.add_argument("stats", nargs="?", default=DEFAULT_STATS, help=f"Visualizer raw-data JSON (default: {DEFAULT_STATS}).")
+    parser.add_argument("--json", dest="json_out", help="Also write the report as JSON to this path ('-' for stdout only).")
+    parser.add_argument("--top", type=int, help="Only print the N largest duplicates in the text report.")
+    parser.add_argument("--root", default=".", help="Project root used to resolve package.json versions.")
+    args = parser.parse_args()
+
+    duplicates = find_duplicates(aggregate_packages(load_stats(args.stats), args.root))
+
+    if args.json_out == "-":
+        print(json.dumps(duplicates, indent=2))
+        return
+    print(format_report(duplicates, args.top))
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(duplicates, f, indent=2)
+        print(f"\nJSON report written to {args.json_out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
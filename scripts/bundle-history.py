@@ -0,0 +1,333 @@
+"""
+Byte-level bundle size history across commits.
+
+Each `bundle/stats.json` is reduced to per-chunk, per-category and
+per-package rendered/gzip/brotli totals and stored in a small SQLite file,
+so slow bundle creep can be traced back to the commit that caused it.
+
+Usage:
+  python scripts/bundle-history.py ingest bundle/stats.json --sha <commit>
+  python scripts/bundle-history.py backfill <artifacts-dir>
+  python scripts/bundle-history.py query --chunk telemetry --grew 10
+  python scripts/bundle-history.py report --out <dir>
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from bundle_stats import (
+    category_of,
+    iter_module_parts,
+    load_stats,
+    package_of,
+    part_sizes,
+    stable_chunk_name,
+)
+
+DEFAULT_DB = "bundle/history.sqlite"
+DASHBOARD_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bundle-history-dashboard.html")
+METRICS = ("rendered", "gzip", "brotli")
+KINDS = ("chunk", "category", "package")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    id INTEGER PRIMARY KEY,
+    sha TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS names (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (kind, name)
+);
+CREATE TABLE IF NOT EXISTS sizes (
+    commit_id INTEGER NOT NULL REFERENCES commits(id) ON DELETE CASCADE,
+    name_id INTEGER NOT NULL REFERENCES names(id),
+    rendered INTEGER NOT NULL,
+    gzip INTEGER NOT NULL,
+    brotli INTEGER NOT NULL,
+    PRIMARY KEY (commit_id, name_id)
+) WITHOUT ROWID;
+"""
+
+
+def connect(db_path):
+    if os.path.dirname(db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def to_utc(date):
+    """Normalize an ISO date to UTC ("2026-01-01T18:00:00+00:00"); dates are sorted as text.
+
+    Dates without an offset are taken as UTC.
+    """
+    parsed = datetime.fromisoformat(date.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def summarize(data, root="."):
+    """Reduce a stats.json to {(kind, name): [rendered, gzip, brotli]}."""
+    totals = defaultdict(lambda: [0, 0, 0])
+    for chunk_name, module_id, part in iter_module_parts(data):
+        sizes = part_sizes(part)
+        keys = [('chunk', stable_chunk_name(chunk_name)), ('category', category_of(module_id))]
+        package = package_of(module_id, root)
+        if package:
+            keys.append(('package', package))
+        for key in keys:
+            for i, size in enumerate(sizes):
+                totals[key][i] += size
+    return totals
+
+
+def commit_date(sha):
+    """Committer date from git in UTC, or None when the commit isn't available locally."""
+    try:
+        result = subprocess.run(["git", "show", "-s", "--format=%ct", sha],
+                                capture_output=True, text=True, check=True)
+        timestamp = result.stdout.strip()
+        if timestamp:
+            return datetime.fromtimestamp(int(timestamp), timezone.utc).isoformat(timespec="seconds")
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        pass
+    return None
+
+
+def ingest(conn, stats_path, sha, date=None, root=".", replace=False):
+    """Store one stats.json under `sha`. Returns False if it was already present.
+
+    Raises ValueError when no date is given and git can't resolve `sha`, since
+    the commit couldn't be placed in the history otherwise.
+    """
+    existing = conn.execute("SELECT id FROM commits WHERE sha = ?", (sha,)).fetchone()
+    if existing and not replace:
+        return False
+
+    date = to_utc(date) if date else commit_date(sha)
+    if date is None:
+        raise ValueError(f"commit {sha} not found in local git history; pass --date")
+    if existing:
+        conn.execute("DELETE FROM commits WHERE id = ?", existing)
+
+    totals = summarize(load_stats(stats_path), root)
+    cur = conn.execute("INSERT INTO commits (sha, date) VALUES (?, ?)", (sha, date))
+    commit_id = cur.lastrowid
+
+    rows = []
+    for (kind, name), sizes in totals.items():
+        conn.execute("INSERT OR IGNORE INTO names (kind, name) VALUES (?, ?)", (kind, name))
+        name_id = conn.execute("SELECT id FROM names WHERE kind = ? AND name = ?", (kind, name)).fetchone()[0]
+        rows.append((commit_id, name_id, *sizes))
+    conn.executemany("INSERT INTO sizes VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    return True
+
+
+def find_artifacts(artifacts_dir):
+    """Yield (sha, stats_path) from an artifacts directory.
+
+    Accepts either <dir>/<sha>/stats.json (optionally under bundle/) or <dir>/<sha>.json.
+    """
+    for root, dirs, files in os.walk(artifacts_dir):
+        dirs.sort()
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            if file == "stats.json":
+                rel = os.path.relpath(root, artifacts_dir).split(os.sep)
+                rel = [p for p in rel if p not in (".", "bundle")]
+                if rel:
+                    yield rel[0], path
+            elif file.endswith(".json") and root == artifacts_dir:
+                yield file[:-len(".json")], path
+
+
+def load_commits(conn):
+    """Return [(sha, date), ...] in commit date order."""
+    return conn.execute("SELECT sha, date FROM commits ORDER BY date, id").fetchall()
+
+
+def load_series(conn, kind, pattern=None):
+    """Return {name: [(sha, date, rendered, gzip, brotli), ...]} in commit date order."""
+    query = """
+        SELECT n.name, c.sha, c.date, s.rendered, s.gzip, s.brotli
+        FROM sizes s
+        JOIN commits c ON c.id = s.commit_id
+        JOIN names n ON n.id = s.name_id
+        WHERE n.kind = ?
+    """
+    params = [kind]
+    if pattern:
+        query += " AND n.name LIKE ?"
+        params.append(f"%{pattern}%")
+    query += " ORDER BY c.date, c.id"
+
+    series = defaultdict(list)
+    for name, *row in conn.execute(query, params):
+        series[name].append(tuple(row))
+    return series
+
+
+def find_growth(series, commits, metric, threshold_bytes):
+    """Find commits where a series grew by at least threshold_bytes.
+
+    Returns (jumps, crossings): single-commit increases, and the first commit
+    whose size exceeds the series' starting size by the threshold (slow creep).
+    A series absent from a commit counts as 0 there, so a chunk that first
+    appears at 11 KB is an 11 KB jump.
+    """
+    idx = 2 + METRICS.index(metric)
+    jumps, crossings = [], []
+    for name, present in series.items():
+        by_sha = {point[0]: point for point in present}
+        points = [by_sha.get(sha, (sha, date, 0, 0, 0)) for sha, date in commits]
+        crossed = False
+        for prev, cur in zip(points, points[1:]):
+            delta = cur[idx] - prev[idx]
+            if delta >= threshold_bytes:
+                jumps.append({'name': name, 'sha': cur[0], 'date': cur[1],
+                              'before': prev[idx], 'after': cur[idx], 'delta': delta})
+            if not crossed and cur[idx] - points[0][idx] >= threshold_bytes:
+                crossed = True
+                crossings.append({'name': name, 'sha': cur[0], 'date': cur[1], 'base_sha': points[0][0],
+                                  'before': points[0][idx], 'after': cur[idx],
+                                  'delta': cur[idx] - points[0][idx]})
+    jumps.sort(key=lambda j: j['date'])
+    return jumps, crossings
+
+
+def build_report(conn, top_packages=25):
+    """Return a JSON-serializable trend report for the dashboard."""
+    commits = [{'sha': sha, 'date': date}
+               for sha, date in load_commits(conn)]
+    position = {c['sha']: i for i, c in enumerate(commits)}
+
+    report = {'generated': datetime.now(timezone.utc).isoformat(timespec="seconds"),
+              'metrics': list(METRICS), 'commits': commits}
+    for kind in KINDS:
+        series = {}
+        for name, points in load_series(conn, kind).items():
+            values = [None] * len(commits)
+            for sha, _date, *sizes in points:
+                values[position[sha]] = sizes
+            series[name] = values
+        if kind == 'package':
+            # Keep the report small: only the packages that are largest in the latest build
+            latest = lambda values: next((v[1] for v in reversed(values) if v), 0)
+            series = dict(sorted(series.items(), key=lambda item: latest(item[1]), reverse=True)[:top_packages])
+        report[kind] = series
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track bundle byte sizes across commits.")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"SQLite history file (default: {DEFAULT_DB}).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ingest", help="Add one stats.json to the history.")
+    p.add_argument("stats", help="Visualizer raw-data JSON (bundle/stats.json).")
+    p.add_argument("--sha", required=True, help="Commit the build was made from.")
+    p.add_argument("--date", help="ISO date for the commit, stored as UTC (default: git committer date; required if git can't resolve --sha).")
+    p.add_argument("--root", default=".", help="Project root used to resolve package.json versions.")
+    p.add_argument("--replace", action="store_true", help="Overwrite an existing entry for this commit.")
+
+    p = sub.add_parser("backfill", help="Ingest every stats.json found in an artifacts directory.")
+    p.add_argument("artifacts", help="Directory of <sha>/stats.json or <sha>.json files.")
+    p.add_argument("--root", default=".", help="Project root used to resolve package.json versions.")
+
+    p = sub.add_parser("query", help="Show a size series, or the commits where it grew.")
+    group = p.add_mutually_exclusive_group(required=True)
+    for kind in KINDS:
+        group.add_argument(f"--{kind}", help=f"Substring of the {kind} name.")
+    p.add_argument("--grew", type=float, help="Only report growth of at least this many KB.")
+    p.add_argument("--metric", choices=METRICS, default="gzip", help="Size to compare (default: gzip).")
+    p.add_argument("--json", action="store_true", help="Print JSON instead of text.")
+
+    p = sub.add_parser("report", help="Write the static trend dashboard (HTML + JSON).")
+    p.add_argument("--out", default="bundle", help="Output directory (default: bundle).")
+    p.add_argument("--top-packages", type=int, default=25, help="Number of packages to include.")
+
+    args = parser.parse_args()
+    if args.command in ("query", "report") and not os.path.exists(args.db):
+        raise SystemExit(f"Error: no history database at {args.db} (run 'ingest' or 'backfill' first, or pass --db)")
+    conn = connect(args.db)
+
+    if args.command == "ingest":
+        try:
+            added = ingest(conn, args.stats, args.sha, args.date, args.root, args.replace)
+        except ValueError as e:
+            raise SystemExit(f"Error: {e}")
+        if added:
+            print(f"Ingested {args.stats} as {args.sha[:7]}")
+        else:
+            print(f"{args.sha[:7]} already in history (use --replace to overwrite)")
+
+    elif args.command == "backfill":
+        added = skipped = unresolved = 0
+        for sha, path in find_artifacts(args.artifacts):
+            try:
+                if ingest(conn, path, sha, root=args.root):
+                    added += 1
+                    print(f"  Ingested {sha[:7]} from {path}")
+                else:
+                    skipped += 1
+            except ValueError as e:
+                unresolved += 1
+                print(f"  Warning: skipping {path}: {e} (ingest it individually)", file=sys.stderr)
+        print(f"Backfill complete: {added} added, {skipped} already present, {unresolved} unresolved")
+
+    elif args.command == "query":
+        kind = next(k for k in KINDS if getattr(args, k))
+        series = load_series(conn, kind, getattr(args, kind))
+        idx = 2 + METRICS.index(args.metric)
+        kb = lambda b: f"{b / 1024:.2f} KB"
+
+        if args.grew is None:
+            if args.json:
+                print(json.dumps({name: [dict(zip(('sha', 'date', *METRICS), p)) for p in points]
+                                  for name, points in series.items()}, indent=2))
+                return
+            for name, points in series.items():
+                print(name)
+                for point in points:
+                    print(f"    {point[1][:10]}  {point[0][:7]}  {kb(point[idx]):>12}")
+            return
+
+        jumps, crossings = find_growth(series, load_commits(conn), args.metric, args.grew * 1024)
+        if args.json:
+            print(json.dumps({'jumps': jumps, 'crossings': crossings}, indent=2))
+            return
+        print(f"Single-commit growth >= {args.grew} KB ({args.metric}):")
+        if not jumps:
+            print("    none")
+        for j in jumps:
+            print(f"    {j['date'][:10]}  {j['sha'][:7]}  {j['name']}: {kb(j['before'])} -> {kb(j['after'])} (+{kb(j['delta'])})")
+        print(f"Cumulative growth >= {args.grew} KB since first record ({args.metric}):")
+        if not crossings:
+            print("    none")
+        for c in crossings:
+            print(f"    {c['date'][:10]}  {c['sha'][:7]}  {c['name']}: {kb(c['before'])} @ {c['base_sha'][:7]} -> {kb(c['after'])} (+{kb(c['delta'])})")
+
+    elif args.command == "report":
+        os.makedirs(args.out, exist_ok=True)
+        with open(os.path.join(args.out, "bundle-history.json"), 'w') as f:
+            json.dump(build_report(conn, args.top_packages), f, separators=(",", ":"))
+        shutil.copyfile(DASHBOARD_TEMPLATE, os.path.join(args.out, "bundle-history.html"))
+        print(f"Trend report written to {args.out}/bundle-history.html")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Shared helpers for reading the rollup-plugin-visualizer raw-data export
+(`bundle/stats.json`, written by `vite build --mode production`).
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+DEFAULT_STATS = "bundle/stats.json"
+SIZE_FIELDS = ("renderedLength", "gzipLength", "brotliLength")
+
+# bun / pnpm isolated installs encode the version in the store directory name,
+# e.g. node_modules/.bun/react-dom@19.1.0/node_modules/react-dom/...
+#      node_modules/.pnpm/@radix-ui+react-dialog@1.1.14_react@19.1.0/node_modules/@radix-ui/react-dialog/...
+STORE_DIR_RE = re.compile(r"node_modules/\.(?:bun|pnpm)/(@?[^/@]+)@([^/_]+)")
+
+# Rolldown appends an 8 character content hash: build/vendor-telemetry-BxY_12ab.js
+CHUNK_HASH_RE = re.compile(r"-[A-Za-z0-9_-]{8}(?=\.[a-z]+$)")
+
+# Same buckets as analyze-stats.py; anything else is "vendor" (node_modules) or "app"
+CATEGORIES = [
+    ('socket.io', ('/socket.io/', 'node_modules/socket.io', 'socket-io')),
+    ('sentry', ('/sentry/', 'node_modules/@sentry/')),
+    ('events', ('web-vitals', 'react-ga4')),
+]
+
+
+def load_stats(file_path):
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def clean_module_id(module_id):
+    """Strip rollup virtual-module prefixes and plugin query strings."""
+    module_id = module_id.lstrip("\0")
+    return module_id.split("?", 1)[0].replace("\\", "/")
+
+
+def iter_module_parts(data):
+    """Yield (chunk_name, module_id, part) for every rendered module part.
+
+    `part` is the nodeParts entry carrying renderedLength/gzipLength/brotliLength.
+    """
+    node_parts = data.get('nodeParts', {})
+    node_metas = data.get('nodeMetas')
+
+    if node_metas:
+        for meta in node_metas.values():
+            module_id = clean_module_id(meta.get('id', ''))
+            for chunk_name, part_uid in meta.get('moduleParts', {}).items():
+                part = node_parts.get(part_uid)
+                if part:
+                    yield chunk_name, module_id, part
+        return
+
+    # Older exports without nodeMetas: walk the tree, top level children are chunks
+    def walk(node, chunk_name, path):
+        name = node.get('name', '')
+        current_path = f"{path}/{name}" if path else name
+        uid = node.get('uid')
+        if uid and uid in node_parts:
+            yield chunk_name, clean_module_id(current_path), node_parts[uid]
+        for child in node.get('children', []):
+            yield from walk(child, chunk_name, current_path)
+
+    for chunk in data.get('tree', {}).get('children', []):
+        yield from walk(chunk, chunk.get('name', ''), "")
+
+
+def stable_chunk_name(chunk_name):
+    """Drop the content hash so a chunk can be followed across builds.
+
+    Unnamed chunks (build/chunk-[hash].js) all collapse into build/chunk.js.
+    """
+    return CHUNK_HASH_RE.sub("", chunk_name)
+
+
+def category_of(module_id):
+    for category, patterns in CATEGORIES:
+        if any(pattern in module_id for pattern in patterns):
+            return category
+    return 'vendor' if 'node_modules/' in module_id else 'app'
+
+
+def part_sizes(part):
+    """Return (rendered, gzip, brotli) bytes for a nodeParts entry."""
+    return tuple(part.get(field, 0) or 0 for field in SIZE_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _read_package_version(package_dir):
+    try:
+        with open(os.path.join(package_dir, "package.json"), 'r') as f:
+            return json.load(f).get("version")
+    except (OSError, ValueError):
+        return None
+
+
+def package_of(module_id, root="."):
+    """Return "name@version" for a node_modules module, or None for app code.
+
+    The version comes from a bun/pnpm store directory in the path when present,
+    otherwise from the package's package.json on disk. Unknown versions are
+    reported as "name@?".
+    """
+    idx = module_id.rfind("node_modules/")
+    if idx == -1:
+        return None
+
+    rest = module_id[idx + len("node_modules/"):].split("/")
+    if rest[0].startswith("@") and len(rest) > 1:
+        name = f"{rest[0]}/{rest[1]}"
+    else:
+        name = rest[0]
+
+    version = None
+    stores = list(STORE_DIR_RE.finditer(module_id[:idx]))
+    if stores and stores[-1].group(1).replace("+", "/") == name:
+        version = stores[-1].group(2)
+
+    if version is None:
+        # Visualizer ids are usually root-relative ("/node_modules/..."), so try both
+        package_dir = module_id[:idx + len("node_modules/") + len(name)]
+        version = (_read_package_version(package_dir)
+                   or _read_package_version(os.path.join(root, package_dir.lstrip("/"))))
+
+    return f"{name}@{version or '?'}"
+
+
+def split_package(package):
+    """Split "name@version" (including scoped names) into (name, version)."""
+    name, _, version = package.rpartition("@")
+    return name, version
+
+
+def module_graph(data):
+    """Build the module import graph from nodeMetas.
+
+    Returns {uid: {'id', 'chunks', 'parts', 'static', 'dynamic', 'is_entry'}} where
+    `parts` is {chunk: [rendered, gzip, brotli]} for each copy of the module (a
+    module duplicated into several chunks has one entry per chunk) and
+    `static`/`dynamic` are the uids it imports.
+    """
+    node_parts = data.get('nodeParts', {})
+    graph = {}
+    for uid, meta in data.get('nodeMetas', {}).items():
+        parts = {chunk: list(part_sizes(node_parts.get(part_uid, {})))
+                 for chunk, part_uid in meta.get('moduleParts', {}).items()}
+        imported = meta.get('imported', [])
+        graph[uid] = {
+            'id': clean_module_id(meta.get('id', '')),
+            'chunks': sorted(parts),
+            'parts': parts,
+            'static': [i['uid'] for i in imported if not i.get('dynamic')],
+            'dynamic': [i['uid'] for i in imported if i.get('dynamic')],
+            'is_entry': bool(meta.get('isEntry')),
+        }
+    return graph
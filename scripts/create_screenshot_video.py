@@ -6,11 +6,28 @@ Create a video from git history of a screenshot with crossfades between frames.
 import subprocess
 import tempfile
 import os
+import time
 from pathlib import Path
 import sys
 
 SCREENSHOT_PATH = "public/assets/img/screenshots/screenshot.png"
 OUTPUT_VIDEO = "screenshot_evolution.mp4"
+VIDEO_WIDTH = 1280
+VIDEO_HEIGHT = 1024
+MASTER_VIDEO = "_temp_master.mp4"  # Lossless concat of all transitions, decoded once for every output
+
+# Final outputs, all encoded from a single decode of MASTER_VIDEO via ffmpeg `split`.
+# codec: libx264 | libvpx-vp9 | libwebp | gif
+# width/height: output size (defaults to VIDEO_WIDTH x VIDEO_HEIGHT)
+# crf: quality for libx264/libvpx-vp9; quality: 0-100 for libwebp
+# fps: optional frame rate cap (useful for animated previews)
+# audio: audio codec, or None for silent outputs
+OUTPUT_TARGETS = [
+    {"path": OUTPUT_VIDEO, "codec": "libx264", "crf": 23, "audio": "aac"},
+    {"path": "screenshot_evolution.webm", "codec": "libvpx-vp9", "crf": 34, "audio": "libopus"},
+    {"path": "screenshot_evolution_preview.webp", "codec": "libwebp", "width": 640, "height": 512,
+     "quality": 70, "fps": 12, "audio": None},
+]
 AUDIO_FILE = "audio/freez_demo.mp3"  # Audio track to add (will be truncated to video length)
 KEEP_FRAMES = True  # Set to True to keep extracted frames in a 'frames' directory
 CROSSFADE_DURATION = 0.65  # Duration of crossfade in seconds
@@ -26,6 +43,13 @@ BLACKLIST_COMMITS = ["ceb3076", "149d704", "0a85a58", "e9769bf"]
 # Use BLACKLIST_COMMITS instead for more reliable exclusion
 SKIP_FRAMES = []
 
+SCALE_FILTER = (
+    f"scale={VIDEO_WIDTH}:{VIDEO_HEIGHT}:force_original_aspect_ratio=decrease,"
+    f"pad={VIDEO_WIDTH}:{VIDEO_HEIGHT}:(ow-iw)/2:(oh-ih)/2"
+)
+# Intermediates are lossless so each final target is only encoded lossily once
+INTERMEDIATE_CODEC_ARGS = ["-c:v", "libx264", "-preset", "ultrafast", "-qp", "0", "-pix_fmt", "yuv420p"]
+
 
 def get_screenshot_history():
     """Get all commits that modified the screenshot in reverse chronological order."""
@@ -115,6 +139,96 @@ def calculate_durations(num_files):
     return image_duration, image_duration, crossfade_duration  # Return (per_image_duration, hold_duration, crossfade)
 
 
+def target_codec_args(target):
+    """Return the encoder arguments for one output target."""
+    codec = target["codec"]
+    if codec == "libx264":
+        return ["-c:v", "libx264", "-crf", str(target.get("crf", 23)), "-pix_fmt", "yuv420p",
+                "-movflags", "+faststart"]
+    if codec == "libvpx-vp9":
+        return ["-c:v", "libvpx-vp9", "-crf", str(target.get("crf", 34)), "-b:v", "0",
+                "-pix_fmt", "yuv420p", "-row-mt", "1",
+                # libvpx's default speed settings are very slow at this size,
+                # and the MP4 waits for it in the shared pass
+                "-deadline", "good", "-cpu-used", str(target.get("cpu_used", 4))]
+    if codec == "libwebp":
+        return ["-c:v", "libwebp", "-quality", str(target.get("quality", 75)), "-loop", "0"]
+    if codec == "gif":
+        return ["-c:v", "gif", "-loop", "0"]
+    raise ValueError(f"Unsupported output codec: {codec}")
+
+
+def build_output_graph(targets, has_audio):
+    """Build the filter_complex that splits one decoded stream into every target.
+
+    Returns (filter_complex, [(video_label, audio_label or None), ...]).
+    """
+    n = len(targets)
+    chains = [f"[0:v]split={n}" + "".join(f"[s{i}]" for i in range(n)) if n > 1 else "[0:v]null[s0]"]
+
+    audio_targets = [i for i, t in enumerate(targets) if has_audio and t.get("audio")]
+    if audio_targets:
+        # Add 2-second fade-out at the end of audio
+        fade_start = TOTAL_VIDEO_DURATION - 2
+        fade = f"[1:a]afade=t=out:st={fade_start}:d=2"
+        if len(audio_targets) > 1:
+            chains.append(f"{fade},asplit={len(audio_targets)}" + "".join(f"[a{i}]" for i in audio_targets))
+        else:
+            chains.append(f"{fade}[a{audio_targets[0]}]")
+
+    labels = []
+    for i, target in enumerate(targets):
+        filters = []
+        if target.get("fps"):
+            filters.append(f"fps={target['fps']}")
+        width = target.get("width", VIDEO_WIDTH)
+        height = target.get("height", VIDEO_HEIGHT)
+        if (width, height) != (VIDEO_WIDTH, VIDEO_HEIGHT):
+            filters.append(f"scale={width}:{height}:flags=lanczos")
+        if target["codec"] == "gif":
+            # Per-target palette for acceptable GIF quality
+            chain = ",".join(filters + ["split"]) + f"[g{i}a][g{i}b];"
+            chain = f"[s{i}]{chain}[g{i}a]palettegen[p{i}];[g{i}b][p{i}]paletteuse[v{i}]"
+        else:
+            chain = f"[s{i}]{','.join(filters) or 'null'}[v{i}]"
+        chains.append(chain)
+        labels.append((f"[v{i}]", f"[a{i}]" if i in audio_targets else None))
+
+    return ";".join(chains), labels
+
+
+def encode_outputs(master_file, targets, audio_file=None):
+    """Encode every output target from a single decode of master_file.
+
+    Prints a per-target size report. All encoders run in one ffmpeg process, so
+    there is no per-target time; the wall time of the single pass is printed once.
+    """
+    filter_complex, labels = build_output_graph(targets, audio_file is not None)
+
+    cmd = ["ffmpeg", "-y", "-i", master_file]
+    if audio_file:
+        cmd += ["-i", audio_file]
+    cmd += ["-filter_complex", filter_complex]
+    for target, (video_label, audio_label) in zip(targets, labels):
+        cmd += ["-map", video_label]
+        if audio_label:
+            cmd += ["-map", audio_label, "-c:a", target["audio"]]
+        cmd += target_codec_args(target)
+        cmd += ["-t", str(TOTAL_VIDEO_DURATION), target["path"]]
+
+    print(f"Encoding {len(targets)} output(s) from a single decode...")
+    start = time.perf_counter()
+    subprocess.run(cmd, capture_output=True, check=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Output':<40} {'Codec':<12} {'Size':>10} {'Bitrate':>12}")
+    for target in targets:
+        size = os.path.getsize(target["path"])
+        kbps = size * 8 / 1000 / TOTAL_VIDEO_DURATION
+        print(f"{target['path']:<40} {target['codec']:<12} {size / 1024:>8.1f}KB {kbps:>8.0f}kbps")
+    print(f"Encode time: {elapsed:.1f}s for all {len(targets)} output(s) (one shared pass)")
+
+
 def create_video(files):
     """Create video with crossfades by pre-rendering each transition."""
     if len(files) < 2:
@@ -149,8 +263,8 @@ def create_video(files):
             cmd = [
                 "ffmpeg", "-y", "-loop", "1", "-i", files[i],
                 "-t", str(duration),
-                "-vf", "scale=1280:1024:force_original_aspect_ratio=decrease,pad=1280:1024:(ow-iw)/2:(oh-ih)/2",
-                "-c:v", "libx264", "-crf", "23", "-pix_fmt", "yuv420p",
+                "-vf", SCALE_FILTER,
+                *INTERMEDIATE_CODEC_ARGS,
                 img1_file
             ]
             subprocess.run(cmd, capture_output=True, check=True)
@@ -159,8 +273,8 @@ def create_video(files):
             cmd = [
                 "ffmpeg", "-y", "-loop", "1", "-i", files[i+1],
                 "-t", str(duration),
-                "-vf", "scale=1280:1024:force_original_aspect_ratio=decrease,pad=1280:1024:(ow-iw)/2:(oh-ih)/2",
-                "-c:v", "libx264", "-crf", "23", "-pix_fmt", "yuv420p",
+                "-vf", SCALE_FILTER,
+                *INTERMEDIATE_CODEC_ARGS,
                 img2_file
             ]
             subprocess.run(cmd, capture_output=True, check=True)
@@ -172,9 +286,7 @@ def create_video(files):
                 "-i", img2_file,
                 "-filter_complex", f"[0:v][1:v]xfade=transition=fade:duration={crossfade_dur}:offset={img1_duration}[v];[v]trim=0:{duration}[trimmed]",
                 "-map", "[trimmed]",
-                "-c:v", "libx264",
-                "-crf", "23",
-                "-pix_fmt", "yuv420p",
+                *INTERMEDIATE_CODEC_ARGS,
                 transition_file
             ]
             subprocess.run(xfade_cmd, capture_output=True, check=True)
@@ -193,8 +305,8 @@ def create_video(files):
         cmd = [
             "ffmpeg", "-y", "-loop", "1", "-i", files[-1],
             "-t", str(hold_dur),
-            "-vf", "scale=1280:1024:force_original_aspect_ratio=decrease,pad=1280:1024:(ow-iw)/2:(oh-ih)/2",
-            "-c:v", "libx264", "-crf", "23", "-pix_fmt", "yuv420p",
+            "-vf", SCALE_FILTER,
+            *INTERMEDIATE_CODEC_ARGS,
             last_screenshot_file
         ]
         subprocess.run(cmd, capture_output=True, check=True)
@@ -209,36 +321,21 @@ def create_video(files):
         concat_file.close()
 
         concat_cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", concat_file.name,
-                      "-c", "copy", OUTPUT_VIDEO]
+                      "-c", "copy", MASTER_VIDEO]
 
         print(f"Concatenating {len(temp_videos)} transitions...")
         subprocess.run(concat_cmd, capture_output=True, check=True)
         os.unlink(concat_file.name)
-        print(f"Video created: {OUTPUT_VIDEO}")
-        
-        # Add audio track if file exists
+        temp_videos.append(MASTER_VIDEO)
+
         if os.path.exists(AUDIO_FILE):
             print(f"Adding audio track from {AUDIO_FILE}...")
-            temp_video_with_audio = "_temp_with_audio.mp4"
-            # Add 2-second fade-out at the end of audio
-            fade_start = TOTAL_VIDEO_DURATION - 2
-            audio_cmd = [
-                "ffmpeg", "-y",
-                "-i", OUTPUT_VIDEO,
-                "-i", AUDIO_FILE,
-                "-c:v", "copy",
-                "-c:a", "aac",
-                "-af", f"afade=t=out:st={fade_start}:d=2",
-                "-t", str(TOTAL_VIDEO_DURATION),
-                "-shortest",
-                temp_video_with_audio
-            ]
-            subprocess.run(audio_cmd, capture_output=True, check=True)
-            os.unlink(OUTPUT_VIDEO)
-            os.rename(temp_video_with_audio, OUTPUT_VIDEO)
-            print(f"Audio track added to: {OUTPUT_VIDEO}")
+            audio_file = AUDIO_FILE
         else:
             print(f"Note: Audio file not found at {AUDIO_FILE}, skipping audio")
+            audio_file = None
+
+        encode_outputs(MASTER_VIDEO, OUTPUT_TARGETS, audio_file)
 
         return True
     except subprocess.CalledProcessError as e:
@@ -0,0 +1,250 @@
+"""
+Index public/assets/img against the references in the source tree.
+
+Walks src/, the locale markdown and the HTML/Vite entry points the same way
+refactor_imports.py walks src/, and reports as JSON:
+  * unused     - images nothing references (bytes saved = file size)
+  * oversized  - images with far more pixels than they are rendered at
+  * variants   - PNG/JPEG/WebP images without a smaller WebP/AVIF sibling
+  * dynamic    - images under a path built at runtime (e.g. `/assets/img/grid/${cell.image}`),
+                 which can't be proven unused without --names
+
+Usage: python scripts/index_assets.py [--out report.json] [--names backend-data.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+IMG_ROOT = "public/assets/img"
+URL_PREFIX = "/assets/img/"
+SCAN_DIRS = ["src", "public/assets/locales"]
+SCAN_FILES = ["index.html", "vite.config.ts"]
+SCAN_EXTENSIONS = (".ts", ".tsx", ".scss", ".css", ".mjs", ".md", ".html", ".json")
+SKIP_PATTERNS = (".test.", ".spec.", ".stories.")  # Fixtures reference made-up paths
+IMAGE_EXTENSIONS = (".webp", ".png", ".jpg", ".jpeg", ".avif", ".gif", ".svg", ".ico")
+
+# Static and runtime-built references: "/assets/img/grid/empty.webp", `/assets/img/grid/${...}`,
+# "https://nms-optimizer.app/assets/img/...". The path stops at quotes, whitespace, ")", "?", "#" or "${".
+# "@/assets/img/..." is the src/assets alias, not public/, so it is skipped.
+REF_RE = re.compile(r'(?<![@\w])(?:https?://[^/\s"\'`)]+)?(/assets/img/[^\s"\'`)?#$]*)(\$\{)?')
+IMG_TAG_RE = re.compile(r'<img\b[^>]*>', re.S)
+ATTR_RE = re.compile(r'\b(width|height)=["{]?(\d+)')
+
+# CSS-pixel size images are rendered at, for runtime-built paths. Matches GridCell
+# (64x64), TechTreeRow and TechTreeSectionHeader; see also process-images.mjs.
+RENDERED_SIZES = {
+    "grid/": (64, 64),
+    "tech/": (60, 60),
+    "sidebar/": (36, 24),
+}
+OVERSIZE_FACTOR = 1.5  # Flag images with more than 1.5x the pixels needed in each dimension
+
+# Typical size of a re-encoded variant relative to the original format.
+# WebP: ~26% smaller than PNG, ~30% smaller than JPEG. AVIF: ~50% smaller than
+# PNG/JPEG and ~20% smaller than WebP. These are estimates, not measurements.
+VARIANT_RATIOS = {
+    ".png": {".webp": 0.74, ".avif": 0.5},
+    ".jpg": {".webp": 0.7, ".avif": 0.5},
+    ".jpeg": {".webp": 0.7, ".avif": 0.5},
+    ".webp": {".avif": 0.8},
+}
+MIN_VARIANT_BYTES = 4096  # Below this, container overhead eats most of the gain
+
+
+def image_size(file_path):
+    """Return (width, height) from the file header, or None for formats we don't parse."""
+    with open(file_path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return struct.unpack(">II", head[16:24])
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", head[6:10])
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            chunk = head[12:16]
+            if chunk == b"VP8X":
+                return (int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1)
+            if chunk == b"VP8L":
+                bits = int.from_bytes(head[21:25], "little")
+                return ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+            if chunk == b"VP8 ":
+                w, h = struct.unpack("<HH", head[26:30])
+                return (w & 0x3FFF, h & 0x3FFF)
+            return None
+        if head[:2] == b"\xff\xd8":
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                length = struct.unpack(">H", f.read(2))[0]
+                if marker[1] in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                    h, w = struct.unpack(">xHH", f.read(5))
+                    return (w, h)
+                f.seek(length - 2, 1)
+    return None
+
+
+def scan_file(file_path, static_refs, dynamic_prefixes, rendered):
+    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+
+    for match in REF_RE.finditer(content):
+        path = match.group(1)[len(URL_PREFIX):]
+        if match.group(2) or path.endswith("/") or not path.lower().endswith(IMAGE_EXTENSIONS):
+            # Runtime-built path: everything under its directory may be used
+            dynamic_prefixes.setdefault(path[:path.rfind("/") + 1], set()).add(file_path)
+        else:
+            static_refs.setdefault(path, set()).add(file_path)
+
+    # Rendered size from <img width height> around static references
+    for tag in IMG_TAG_RE.finditer(content):
+        attrs = dict(ATTR_RE.findall(tag.group(0)))
+        if "width" in attrs and "height" in attrs:
+            for match in REF_RE.finditer(tag.group(0)):
+                path = match.group(1)[len(URL_PREFIX):]
+                if not match.group(2):
+                    rendered[path] = (int(attrs["width"]), int(attrs["height"]))
+
+
+def scan_references(root="."):
+    """Walk the scan roots and collect static references, runtime prefixes and <img> sizes."""
+    static_refs, dynamic_prefixes, rendered = {}, {}, {}
+    files = [os.path.join(root, f) for f in SCAN_FILES if os.path.exists(os.path.join(root, f))]
+    for scan_dir in SCAN_DIRS:
+        for dirpath, dirs, filenames in os.walk(os.path.join(root, scan_dir)):
+            for file in filenames:
+                if file.endswith(SCAN_EXTENSIONS) and not any(p in file for p in SKIP_PATTERNS):
+                    files.append(os.path.join(dirpath, file))
+    for file_path in files:
+        scan_file(file_path, static_refs, dynamic_prefixes, rendered)
+    return static_refs, dynamic_prefixes, rendered
+
+
+def load_names(names_path):
+    """Collect image file names from a JSON dump of runtime data (e.g. the backend tech tree)."""
+    names = set()
+
+    def walk(value):
+        if isinstance(value, str):
+            if value.lower().endswith(IMAGE_EXTENSIONS):
+                names.add(value.lstrip("/"))
+        elif isinstance(value, dict):
+            for v in value.values():
+                walk(v)
+        elif isinstance(value, list):
+            for v in value:
+                walk(v)
+
+    with open(names_path, "r", encoding="utf-8") as f:
+        walk(json.load(f))
+    return names
+
+
+def density_base(rel_path):
+    """Split "tech/infra@2x.webp" into ("tech/infra.webp", 2)."""
+    match = re.match(r"(.*)@(\d)x(\.\w+)$", rel_path)
+    if match:
+        return match.group(1) + match.group(3), int(match.group(2))
+    return rel_path, 1
+
+
+def index_assets(root=".", names_path=None, workers=1):
+    img_root = os.path.join(root, IMG_ROOT)
+    assets = []
+    for dirpath, dirs, filenames in os.walk(img_root):
+        for file in filenames:
+            if file.lower().endswith(IMAGE_EXTENSIONS):
+                full_path = os.path.join(dirpath, file)
+                assets.append(os.path.relpath(full_path, img_root).replace(os.sep, "/"))
+    assets.sort()
+    asset_set = set(assets)
+
+    static_refs, dynamic_prefixes, rendered = scan_references(root)
+    names = load_names(names_path) if names_path else set()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        sizes = dict(zip(assets, executor.map(lambda a: image_size(os.path.join(img_root, a)), assets)))
+    bytes_of = {a: os.path.getsize(os.path.join(img_root, a)) for a in assets}
+
+    report = {"root": IMG_ROOT, "assets": len(assets), "bytes": sum(bytes_of.values()),
+              "unused": [], "dynamic": [], "oversized": [], "variants": [], "missing": []}
+
+    for path in sorted(static_refs):
+        if path not in asset_set and density_base(path)[0] not in asset_set:
+            report["missing"].append({"path": path, "referenced_by": sorted(static_refs[path])})
+
+    for asset in assets:
+        base, density = density_base(asset)
+        prefix = next((p for p in sorted(dynamic_prefixes, key=len, reverse=True) if asset.startswith(p)), None)
+        referenced = asset in static_refs or base in static_refs
+        if not referenced and prefix is not None and names:
+            # Runtime names are relative to the dynamic prefix, e.g. "starship/infra.webp" under "tech/"
+            referenced = base[len(prefix):] in names
+
+        if not referenced:
+            entry = {"path": asset, "bytes": bytes_of[asset], "saved": bytes_of[asset]}
+            if prefix is None or names:
+                report["unused"].append(entry)
+                continue
+            # Probably used at runtime: list it, but still check size and variants
+            report["dynamic"].append({**entry, "prefix": prefix})
+
+        size = sizes[asset]
+        target = rendered.get(asset) or rendered.get(base)
+        if target is None:
+            target = next((s for p, s in RENDERED_SIZES.items() if asset.startswith(p)), None)
+        if size and target:
+            need_w, need_h = target[0] * density, target[1] * density
+            if size[0] > need_w * OVERSIZE_FACTOR and size[1] > need_h * OVERSIZE_FACTOR:
+                kept = (need_w * need_h) / (size[0] * size[1])
+                report["oversized"].append({
+                    "path": asset, "bytes": bytes_of[asset], "pixels": list(size),
+                    "rendered": [need_w, need_h], "saved": round(bytes_of[asset] * (1 - kept)),
+                })
+
+        stem, ext = os.path.splitext(asset)
+        for variant, ratio in VARIANT_RATIOS.get(ext.lower(), {}).items():
+            if stem + variant not in asset_set and bytes_of[asset] >= MIN_VARIANT_BYTES:
+                report["variants"].append({
+                    "path": asset, "missing": variant, "bytes": bytes_of[asset],
+                    "saved": round(bytes_of[asset] * (1 - ratio)), "estimate": True,
+                })
+
+    for key in ("unused", "dynamic", "oversized", "variants"):
+        report[key].sort(key=lambda item: item["saved"], reverse=True)
+        report[f"{key}_saved"] = sum(item["saved"] for item in report[key])
+    report["dynamic_prefixes"] = {p: sorted(files) for p, files in sorted(dynamic_prefixes.items())}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report unused, oversized and unoptimized images in public/assets/img.")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory).")
+    parser.add_argument("--out", help="Write the JSON report to this path instead of stdout.")
+    parser.add_argument("--names", help="JSON file of runtime data whose image names resolve dynamic paths.")
+    parser.add_argument("--workers", type=int, default=1, help="Threads used to read image headers (default: 1).")
+    args = parser.parse_args()
+
+    report = index_assets(args.root, args.names, args.workers)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        kb = lambda b: f"{b / 1024:.1f} KB"
+        print(f"{report['assets']} images ({kb(report['bytes'])}) indexed -> {args.out}", file=sys.stderr)
+        for key in ("unused", "dynamic", "oversized", "variants"):
+            label = "unverified (runtime paths)" if key == "dynamic" else "saveable"
+            print(f"  {key:<10} {len(report[key]):>4} item(s), {kb(report[key + '_saved'])} {label}", file=sys.stderr)
+        if report["missing"]:
+            print(f"  missing    {len(report['missing']):>4} referenced path(s) not found", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
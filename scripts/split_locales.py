@@ -0,0 +1,239 @@
+"""
+Split each locale's translation.json into precompressed per-namespace bundles.
+
+Every top-level key of translation.json is a namespace, split out with the
+same flattened-key model translate.py uses. Namespaces needed by the same
+set of routes are packed into one bundle ("core" for those every route
+needs), since dozens of sub-kilobyte files compress worse than one file;
+--granular writes one bundle per namespace instead. Bundles are minified and
+named by content hash for long-term caching, with .gz and .br siblings
+(brotli is in requirements.txt). A manifest maps each bundle to its
+namespaces and each locale/bundle to the hashed file.
+
+A size report compares what each route downloads today (the whole
+translation.json) with the namespaces it actually references. Namespaces are
+found by scanning src/ for string literals that start with a top-level key.
+With --stats, only the modules in each route's static-import closure are
+scanned (see analyze-critical-path.py); otherwise every route gets the
+namespaces used anywhere in src/.
+
+Usage: python scripts/split_locales.py [--out dist/assets/locales] [--stats bundle/stats.json] [--report report.json] [--granular]
+"""
+
+import argparse
+import gzip
+import hashlib
+import importlib
+import json
+import os
+import re
+
+import brotli
+
+from translate import BASE_PATH, LANGUAGES, flatten_json, unflatten_json
+
+SOURCE_LANG = "en"
+DEFAULT_OUT = "dist/assets/locales"
+URL_PREFIX = "/assets/locales"
+HASH_LENGTH = 8
+SCAN_DIR = "src"
+SCAN_EXTENSIONS = (".ts", ".tsx")
+SKIP_PATTERNS = (".test.", ".spec.", ".stories.")
+
+
+def split_namespaces(data):
+    """Group a translation tree by top-level key: {namespace: nested subtree}."""
+    groups = {}
+    for key, value in flatten_json(data).items():
+        namespace = key.split(".", 1)[0]
+        groups.setdefault(namespace, {})[key] = value
+    return {namespace: unflatten_json(items)[namespace] for namespace, items in groups.items()}
+
+
+def compress(payload):
+    """Return (gzip bytes, brotli bytes) for a payload."""
+    gz = gzip.compress(payload, compresslevel=9, mtime=0)
+    br = brotli.compress(payload, quality=11)
+    return gz, br
+
+
+def write_bundle(out_dir, lang, name, tree):
+    """Write one minified, hashed bundle plus its compressed siblings."""
+    payload = json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+    filename = f"{name}.{digest}.json"
+    target_dir = os.path.join(out_dir, lang, "ns")
+    os.makedirs(target_dir, exist_ok=True)
+
+    gz, br = compress(payload)
+    with open(os.path.join(target_dir, filename), "wb") as f:
+        f.write(payload)
+    with open(os.path.join(target_dir, filename + ".gz"), "wb") as f:
+        f.write(gz)
+    with open(os.path.join(target_dir, filename + ".br"), "wb") as f:
+        f.write(br)
+
+    return {
+        "path": f"{URL_PREFIX}/{lang}/ns/{filename}",
+        "hash": digest,
+        "bytes": len(payload),
+        "gzip": len(gz),
+        "brotli": len(br),
+    }
+
+
+def plan_bundles(namespaces, routes, granular=False):
+    """Return {bundle name: [namespaces]}, grouping namespaces by the routes that need them."""
+    if granular:
+        return {namespace: [namespace] for namespace in sorted(namespaces)}
+
+    all_routes = frozenset(routes)
+    groups = {}
+    for namespace in sorted(namespaces):
+        needed_by = frozenset(route for route, used in routes.items() if namespace in used)
+        groups.setdefault(needed_by, []).append(namespace)
+
+    bundles = {}
+    for needed_by, members in groups.items():
+        if needed_by == all_routes:
+            name = "core"
+        elif not needed_by:
+            name = "unreferenced"
+        else:
+            name = "_".join(sorted(route.strip("/") or "home" for route in needed_by))
+        bundles[name] = members
+    return bundles
+
+
+def file_sizes(path):
+    """Return {bytes, gzip, brotli} for a file served as-is today."""
+    with open(path, "rb") as f:
+        payload = f.read()
+    gz, br = compress(payload)
+    return {"bytes": len(payload), "gzip": len(gz), "brotli": len(br)}
+
+
+def namespaces_in(file_paths, namespaces):
+    """Namespaces referenced by string literals ("dialogs.titles.about", `technologies.${id}`) in the files."""
+    pattern = re.compile(r'["\'`](' + "|".join(map(re.escape, sorted(namespaces, key=len, reverse=True))) + r')(?=[."\'`])')
+    used = set()
+    for file_path in file_paths:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                used.update(pattern.findall(f.read()))
+        except OSError:
+            continue
+    return used
+
+
+def source_files(root="."):
+    files = []
+    for dirpath, dirs, filenames in os.walk(os.path.join(root, SCAN_DIR)):
+        for file in filenames:
+            if file.endswith(SCAN_EXTENSIONS) and not any(p in file for p in SKIP_PATTERNS):
+                files.append(os.path.join(dirpath, file))
+    return files
+
+
+def project_path(module_id):
+    """Return "src/..." for a project source module id, or None (dependencies, virtual modules)."""
+    path = module_id.lstrip("/")
+    if "node_modules/" in path or not path.startswith(f"{SCAN_DIR}/"):
+        return None
+    return path
+
+
+def route_namespaces(namespaces, stats_path=None, root="."):
+    """Return {route: set(namespaces)} for the routes analyze-critical-path.py knows about."""
+    critical_path = importlib.import_module("analyze-critical-path")
+    if not stats_path:
+        used = namespaces_in(source_files(root), namespaces)
+        return {route: used for route in critical_path.ROUTES}
+
+    from bundle_stats import load_stats, module_graph
+
+    graph = module_graph(load_stats(stats_path))
+    entries = [uid for uid, node in graph.items() if node["is_entry"]]
+    result = {}
+    for route, patterns in critical_path.ROUTES.items():
+        roots = [uid for uid, node in graph.items() if any(p in node["id"] for p in patterns)]
+        files = set()
+        for uid in critical_path.static_closure(graph, entries + roots):
+            path = project_path(graph[uid]["id"])
+            if path:
+                files.add(os.path.join(root, path))
+        result[route] = namespaces_in(sorted(files), namespaces)
+    return result
+
+
+def build(out_dir=DEFAULT_OUT, stats_path=None, root=".", granular=False):
+    locales_dir = os.path.join(root, BASE_PATH)
+    locales, before = {}, {}
+    for lang in [SOURCE_LANG] + list(LANGUAGES):
+        source_file = os.path.join(locales_dir, lang, "translation.json")
+        if not os.path.exists(source_file):
+            continue
+        with open(source_file, "r", encoding="utf-8") as f:
+            locales[lang] = split_namespaces(json.load(f))
+        before[lang] = file_sizes(source_file)
+
+    namespaces = set(locales[SOURCE_LANG])
+    routes = route_namespaces(namespaces, stats_path, root)
+    bundles = plan_bundles(namespaces, routes, granular)
+
+    manifest = {"version": 1, "bundles": bundles, "locales": {}}
+    for lang, trees in locales.items():
+        manifest["locales"][lang] = {
+            name: write_bundle(out_dir, lang, name, {ns: trees[ns] for ns in members if ns in trees})
+            for name, members in bundles.items()
+        }
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent="\t")
+
+    report = {"routes": {}, "unused_namespaces": sorted(namespaces - set().union(*routes.values()))}
+    for route, needed in routes.items():
+        names = sorted(name for name, members in bundles.items() if needed & set(members))
+        report["routes"][route] = {"namespaces": sorted(needed), "bundles": names, "locales": {}}
+        for lang, files in manifest["locales"].items():
+            after = {"bytes": 0, "gzip": 0, "brotli": 0}
+            for name in names:
+                for key in after:
+                    after[key] += files[name][key]
+            after["requests"] = len(names)
+            report["routes"][route]["locales"][lang] = {"before": before[lang], "after": after}
+    return manifest, report
+
+
+def format_report(report):
+    kb = lambda b: f"{b / 1024:.1f} KB"
+    lines = ["Per-route translation bytes (brotli), before -> after:"]
+    for route, info in report["routes"].items():
+        lines.append(f"  {route:<16} {len(info['namespaces'])} namespace(s) in {', '.join(info['bundles'])}")
+        for lang, sizes in info["locales"].items():
+            b, a = sizes["before"]["brotli"], sizes["after"]["brotli"]
+            lines.append(f"      {lang}  {kb(b):>10} -> {kb(a):>10}  ({sizes['after']['requests']} files)")
+    if report["unused_namespaces"]:
+        lines.append(f"Namespaces no route references: {', '.join(report['unused_namespaces'])}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build precompressed per-namespace locale bundles from translation.json.")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"Output directory (default: {DEFAULT_OUT}).")
+    parser.add_argument("--stats", help="bundle/stats.json, to resolve namespaces per route from each route's modules.")
+    parser.add_argument("--report", help="Also write the size report as JSON to this path.")
+    parser.add_argument("--root", default=".", help="Project root (default: current directory).")
+    parser.add_argument("--granular", action="store_true", help="Write one bundle per namespace instead of grouping by route.")
+    args = parser.parse_args()
+
+    manifest, report = build(args.out, args.stats, args.root, args.granular)
+    total = sum(len(files) for files in manifest["locales"].values())
+    print(f"Wrote {total} bundles for {len(manifest['locales'])} locale(s) to {args.out}")
+    print(format_report(report))
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
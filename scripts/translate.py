@@ -1,13 +1,16 @@
 import os
 import json
 import argparse
+import threading
 import time
-from google import genai
-from google.genai import types
-from typing import Dict, Any, List
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-# Configure Gemini
-client = genai.Client(api_key=os.environ.get("GOOGLE_API_KEY"))
+# NOTE: google.genai is imported lazily inside GeminiProvider so that --help,
+# planning and importing helpers like flatten_json don't pay the SDK import
+# or require an API key.
 MODEL_NAME = 'gemini-2.5-flash'
 
 LANGUAGES = {
@@ -20,6 +23,8 @@ LANGUAGES = {
 
 BASE_PATH = "public/assets/locales"
 BATCH_SIZE = 100
+HTTP_POOL_SIZE = 8  # Keep-alive connections shared by concurrent batches
+HTTP_TIMEOUT = 120  # Seconds
 
 def get_system_instruction(target_lang_name: str, is_markdown: bool = False) -> str:
     """Returns the system instruction for the model."""
@@ -37,10 +42,36 @@ def get_system_instruction(target_lang_name: str, is_markdown: bool = False) ->
     instr += f"Return ONLY the translated { 'Markdown' if is_markdown else 'JSON' }. DO NOT return English. DO NOT provide any preamble or conversation."
     return instr
 
-def get_config(target_lang_name: str, is_markdown: bool = False) -> types.GenerateContentConfig:
-    """Returns the model configuration including system instructions and safety settings."""
+def get_fanout_system_instruction(lang_codes: Tuple[str, ...]) -> str:
+    """Returns the system instruction for translating one English batch into several languages at once."""
+    targets = ", ".join(f"'{code}' ({LANGUAGES[code]})" for code in lang_codes)
+    instr = f"You are a professional translator for a No Man's Sky (NMS) Technology Layout Optimizer app. "
+    instr += f"Translate all content provided from English into each of these languages: {targets}. "
+    instr += "Maintain technical NMS terminology exactly as it appears in-game (e.g., 'Exosuit', 'Hyperdrive', 'Adjacency Bonus'). "
+    instr += "Always use Title Case for proper object names like specific technologies and modules. "
+    instr += "The input will be a JSON object of English strings. "
+    instr += "Return a JSON object whose top-level keys are the language codes above; each value is an object with the input keys kept identical and the values translated into that language. "
+    instr += "STRICTLY preserve all i18next tags like <0></0> and placeholders like {{count}}. "
+    instr += "Return ONLY the JSON. DO NOT return English. DO NOT provide any preamble or conversation."
+    return instr
+
+@lru_cache(maxsize=None)
+def get_config(target: Union[str, Tuple[str, ...]], is_markdown: bool = False):
+    """Returns the model configuration including system instructions and safety settings.
+
+    `target` is a language name, or a tuple of language codes for a multi-language
+    fan-out request. Built once per (target, mode) and memoized; the result is
+    treated as read-only.
+    """
+    from google.genai import types
+
+    if isinstance(target, tuple):
+        system_instruction = get_fanout_system_instruction(target)
+    else:
+        system_instruction = get_system_instruction(target, is_markdown)
+
     return types.GenerateContentConfig(
-        system_instruction=get_system_instruction(target_lang_name, is_markdown),
+        system_instruction=system_instruction,
         temperature=0.1, # Low temperature for high precision
         response_mime_type='application/json' if not is_markdown else 'text/plain',
         safety_settings=[
@@ -51,25 +82,166 @@ def get_config(target_lang_name: str, is_markdown: bool = False) -> types.Genera
         ]
     )
 
-def translate_batch(batch: Dict[str, str], target_lang_name: str) -> Dict[str, str]:
-    """Translates a batch of strings in a single API call using system instructions."""
+class EmptyResponseError(Exception):
+    """Raised by a provider when the model returns no text (e.g. blocked by safety filters)."""
+
+class TranslationProvider(ABC):
+    """Minimal interface between the translation pipeline and a model backend.
+
+    Subclasses implement _generate(); generate() adds call/latency accounting so
+    startup and per-call overhead can be compared across providers.
+    """
+    name = "base"
+    request_interval = 0.0  # Seconds to wait after each batch (rate-limit safety buffer)
+    requires_api_key = False
+    deferred_setup = False  # SDK import / client creation happens on the first call
+
+    def __init__(self):
+        self.calls = 0
+        self.elapsed = 0.0
+        self.setup_elapsed = 0.0  # Client creation time, measured on first use
+        self._stats_lock = threading.Lock()
+
+    def generate(self, contents: str, target_lang_name: Union[str, Tuple[str, ...]], is_markdown: bool = False) -> str:
+        """Returns the model's text for `contents`; see get_config() for the meaning of `target_lang_name`."""
+        start = time.perf_counter()
+        try:
+            return self._generate(contents, target_lang_name, is_markdown)
+        finally:
+            duration = time.perf_counter() - start
+            with self._stats_lock:
+                self.calls += 1
+                self.elapsed += duration
+
+    @abstractmethod
+    def _generate(self, contents: str, target_lang_name: Union[str, Tuple[str, ...]], is_markdown: bool) -> str:
+        """Returns the raw model text; raises EmptyResponseError when there is none."""
+
+    def close(self):
+        pass
+
+    def stats(self) -> str:
+        avg_ms = (self.elapsed / self.calls * 1000) if self.calls else 0.0
+        setup = f", client setup {self.setup_elapsed * 1000:.1f}ms" if self.setup_elapsed else ""
+        return f"{self.name}: {self.calls} call(s), {self.elapsed:.2f}s total, {avg_ms:.1f}ms avg{setup}"
+
+class GeminiProvider(TranslationProvider):
+    """Google Gemini backend. The SDK and client are created on first use."""
+    name = "gemini"
+    request_interval = 15.0
+    requires_api_key = True
+    deferred_setup = True
+
+    def __init__(self, api_key: Optional[str] = None):
+        super().__init__()
+        self._api_key = api_key or os.environ.get("GOOGLE_API_KEY")
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    start = time.perf_counter()
+                    from google import genai
+                    from google.genai import types
+                    import httpx
+
+                    # One pooled keep-alive session, shared by every worker thread.
+                    # The SDK passes its own timeout on every request (None = no timeout),
+                    # so it has to be set here rather than as an httpx client default.
+                    http_options = types.HttpOptions(
+                        timeout=HTTP_TIMEOUT * 1000,  # Milliseconds
+                        client_args={
+                            "limits": httpx.Limits(
+                                max_connections=HTTP_POOL_SIZE,
+                                max_keepalive_connections=HTTP_POOL_SIZE,
+                                keepalive_expiry=60,
+                            ),
+                        }
+                    )
+                    self._client = genai.Client(api_key=self._api_key, http_options=http_options)
+                    self.setup_elapsed = time.perf_counter() - start
+        return self._client
+
+    def _generate(self, contents: str, target_lang_name: Union[str, Tuple[str, ...]], is_markdown: bool) -> str:
+        response = self.client.models.generate_content(
+            model=MODEL_NAME,
+            contents=contents,
+            config=get_config(target_lang_name, is_markdown)
+        )
+        if not response.text:
+            safety = response.candidates[0].safety_ratings if response.candidates else 'N/A'
+            raise EmptyResponseError(f"Safety ratings: {safety}")
+        return response.text
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+class StubProvider(TranslationProvider):
+    """Offline provider that echoes the input back after an optional fixed latency.
+
+    Used to measure startup and per-call overhead without network access or an API key.
+    """
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__()
+        self.latency = latency
+
+    def _generate(self, contents: str, target_lang_name: Union[str, Tuple[str, ...]], is_markdown: bool) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        if isinstance(target_lang_name, tuple):
+            batch = json.loads(contents)
+            return json.dumps({code: batch for code in target_lang_name}, ensure_ascii=False)
+        return contents
+
+PROVIDERS = {
+    "gemini": GeminiProvider,
+    "stub": StubProvider,
+}
+
+_provider: Optional[TranslationProvider] = None
+_provider_lock = threading.Lock()
+
+def get_provider() -> TranslationProvider:
+    """Returns the active provider, creating the default Gemini provider on first use."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = GeminiProvider()
+    return _provider
+
+def set_provider(provider: TranslationProvider):
+    """Replaces the active provider (closing the previous one)."""
+    global _provider
+    with _provider_lock:
+        if _provider is not None and _provider is not provider:
+            _provider.close()
+        _provider = provider
+
+def _request_json(batch: Dict[str, str], target: Union[str, Tuple[str, ...]]) -> Dict[str, Any]:
+    """Sends one JSON batch to the provider with rate-limit retries. Returns {} on failure."""
     if not batch:
         return {}
 
     max_retries = 5
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
-                model=MODEL_NAME,
-                contents=json.dumps(batch, ensure_ascii=False),
-                config=get_config(target_lang_name, is_markdown=False)
+            text = get_provider().generate(
+                json.dumps(batch, ensure_ascii=False),
+                target,
+                is_markdown=False
             )
-            
-            if not response.text:
-                print(f"Warning: Empty response for batch. Safety ratings: {response.candidates[0].safety_ratings if response.candidates else 'N/A'}")
-                return {}
-            
-            return json.loads(response.text)
+            return json.loads(text)
+        except EmptyResponseError as e:
+            print(f"Warning: Empty response for batch. {e}")
+            return {}
         except Exception as e:
             error_str = str(e)
             # Handle rate limits (429) and high demand (503)
@@ -82,19 +254,34 @@ def translate_batch(batch: Dict[str, str], target_lang_name: str) -> Dict[str, s
             return {}
     return {}
 
+def translate_batch(batch: Dict[str, str], target_lang_name: str) -> Dict[str, str]:
+    """Translates a batch of strings in a single API call using system instructions."""
+    return _request_json(batch, target_lang_name)
+
+def translate_batch_multi(batch: Dict[str, str], lang_codes: Tuple[str, ...]) -> Dict[str, Dict[str, str]]:
+    """Translates one English batch into several languages in a single API call.
+
+    Returns {lang: {key: value}}. Languages or keys missing from the response are
+    simply absent; callers are expected to fall back to translate_batch for them.
+    """
+    response = _request_json(batch, lang_codes)
+    result = {}
+    for code in lang_codes:
+        translated = response.get(code) if isinstance(response, dict) else None
+        if isinstance(translated, dict):
+            result[code] = {k: v for k, v in translated.items() if k in batch and isinstance(v, str)}
+        else:
+            result[code] = {}
+    return result
+
 def translate_markdown(text: str, target_lang_name: str) -> str:
     """Translates a single markdown file content using system instructions."""
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
-                model=MODEL_NAME,
-                contents=text,
-                config=get_config(target_lang_name, is_markdown=True)
-            )
-            if not response.text:
-                return text
-            return response.text.strip()
+            return get_provider().generate(text, target_lang_name, is_markdown=True).strip()
+        except EmptyResponseError:
+            return text
         except Exception as e:
             error_str = str(e)
             if "429" in error_str or "503" in error_str or "UNAVAILABLE" in error_str:
@@ -166,14 +353,36 @@ def unflatten_json(items: Dict[str, str]) -> Any:
                     
     return result
 
-def process_json(target_lang: str, force: bool = False):
-    target_lang_name = LANGUAGES[target_lang]
-    source_file = os.path.join(BASE_PATH, "en", "translation.json")
-    target_file = os.path.join(BASE_PATH, target_lang, "translation.json")
+def _translate_batch_throttled(batch: Dict[str, str], target_lang_name: str, label: str) -> Dict[str, str]:
+    """Runs one batch on a worker thread, then holds the worker for the provider's safety buffer."""
+    print(f"  Batch {label}...")
+    translated_batch = translate_batch(batch, target_lang_name)
+    time.sleep(get_provider().request_interval) # Safety buffer
+    return translated_batch
+
+def _translate_multi_throttled(batch: Dict[str, str], lang_codes: Tuple[str, ...], label: str) -> Dict[str, Dict[str, str]]:
+    """Fan-out counterpart of _translate_batch_throttled."""
+    print(f"  Batch {label} [{', '.join(lang_codes)}]...")
+    translated = translate_batch_multi(batch, lang_codes)
+    time.sleep(get_provider().request_interval) # Safety buffer
+    return translated
 
+def _run_batches(fn, jobs: List[tuple], workers: int) -> List[Any]:
+    """Runs fn(*job) for each job on a shared pool and returns results in job order."""
+    # Workers share the provider's pooled client; results are merged in batch order.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(fn, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+def load_flat_source() -> Dict[str, str]:
+    """Reads and flattens the English source translation.json."""
+    source_file = os.path.join(BASE_PATH, "en", "translation.json")
     with open(source_file, 'r', encoding='utf-8') as f:
-        source_data = json.load(f)
+        return flatten_json(json.load(f))
 
+def load_flat_target(target_lang: str) -> Dict[str, str]:
+    """Reads and flattens a locale's translation.json, or {} if it is missing or invalid."""
+    target_file = os.path.join(BASE_PATH, target_lang, "translation.json")
     target_data = {}
     if os.path.exists(target_file):
         with open(target_file, 'r', encoding='utf-8') as f:
@@ -181,14 +390,38 @@ def process_json(target_lang: str, force: bool = False):
                 target_data = json.load(f)
             except:
                 target_data = {}
+    return flatten_json(target_data)
 
-    flat_source = flatten_json(source_data)
-    flat_target = flatten_json(target_data)
-
+def keys_to_translate(flat_source: Dict[str, str], flat_target: Dict[str, str], force: bool = False) -> Dict[str, str]:
+    """Returns the English entries that are missing or still untranslated in flat_target."""
     to_translate = {}
     for k, v in flat_source.items():
         if force or k not in flat_target or flat_target[k] == v:
             to_translate[k] = v
+    return to_translate
+
+def write_flat_target(target_lang: str, items: Dict[str, str], dry_run: bool = False):
+    """Unflattens and writes a locale's translation.json."""
+    target_file = os.path.join(BASE_PATH, target_lang, "translation.json")
+    if dry_run:
+        print(f"Dry run: not writing {target_file}.")
+        return
+
+    updated_nested = unflatten_json(items)
+    os.makedirs(os.path.dirname(target_file), exist_ok=True)
+    with open(target_file, 'w', encoding='utf-8') as f:
+        json.dump(updated_nested, f, indent='\t', ensure_ascii=False)
+    print(f"JSON translation for {target_lang} updated.")
+
+def _split_batches(to_translate: Dict[str, str]) -> List[Dict[str, str]]:
+    keys = list(to_translate.keys())
+    return [{k: to_translate[k] for k in keys[i:i + BATCH_SIZE]} for i in range(0, len(keys), BATCH_SIZE)]
+
+def process_json(target_lang: str, force: bool = False, workers: int = 1, dry_run: bool = False):
+    target_lang_name = LANGUAGES[target_lang]
+    flat_source = load_flat_source()
+    flat_target = load_flat_target(target_lang)
+    to_translate = keys_to_translate(flat_source, flat_target, force)
 
     if not to_translate:
         print(f"No keys to translate for {target_lang}.")
@@ -196,23 +429,75 @@ def process_json(target_lang: str, force: bool = False):
 
     print(f"Translating {len(to_translate)} keys for {target_lang} in batches...")
     translated_items = flat_target.copy()
-    keys = list(to_translate.keys())
-    
-    for i in range(0, len(keys), BATCH_SIZE):
-        batch_keys = keys[i:i + BATCH_SIZE]
-        batch = {k: to_translate[k] for k in batch_keys}
-        print(f"  Batch {i//BATCH_SIZE + 1}/{(len(keys)-1)//BATCH_SIZE + 1}...")
-        translated_batch = translate_batch(batch, target_lang_name)
+    batches = _split_batches(to_translate)
+    jobs = [(batch, target_lang_name, f"{n + 1}/{len(batches)}") for n, batch in enumerate(batches)]
+    for translated_batch in _run_batches(_translate_batch_throttled, jobs, workers):
         translated_items.update(translated_batch)
-        time.sleep(15) # Safety buffer
 
-    updated_nested = unflatten_json(translated_items)
-    os.makedirs(os.path.dirname(target_file), exist_ok=True)
-    with open(target_file, 'w', encoding='utf-8') as f:
-        json.dump(updated_nested, f, indent='\t', ensure_ascii=False)
-    print(f"JSON translation for {target_lang} updated.")
+    write_flat_target(target_lang, translated_items, dry_run)
+
+def process_json_fanout(target_langs: List[str], force: bool = False, workers: int = 1, dry_run: bool = False):
+    """Translates translation.json for several languages, sending each English batch once.
+
+    The English source is flattened once and the missing-key matrix is computed for
+    all languages up front. The union of missing keys is split into BATCH_SIZE
+    batches; each request asks for the languages that need any key in its batch,
+    and each language keeps only the keys it needs. This never takes more requests
+    than the per-language path. Keys a response leaves out are retried per
+    language through the single-language path.
+    """
+    flat_source = load_flat_source()
+    flat_targets = {lang: load_flat_target(lang) for lang in target_langs}
+
+    # Missing-key matrix: language -> keys it needs; the union keeps source order.
+    pending = {lang: keys_to_translate(flat_source, flat_targets[lang], force) for lang in target_langs}
+    union = {k: v for k, v in flat_source.items() if any(k in pending[lang] for lang in target_langs)}
+
+    for lang in target_langs:
+        if not pending[lang]:
+            print(f"No keys to translate for {lang}.")
+    if not union:
+        return
+
+    batches = _split_batches(union)
+    jobs = []
+    for n, batch in enumerate(batches):
+        langs = tuple(lang for lang in target_langs if any(k in pending[lang] for k in batch))
+        jobs.append((batch, langs, f"{n + 1}/{len(batches)}"))
+    single_requests = sum(len(_split_batches(pending[lang])) for lang in target_langs)
+    print(f"Fan-out: {len(jobs)} request(s) for {len(target_langs)} language(s) (vs {single_requests} per-language)...")
+
+    translated = {lang: flat_targets[lang].copy() for lang in target_langs}
+    fallback: Dict[str, Dict[str, str]] = {lang: {} for lang in target_langs}
+    for (batch, langs, _), result in zip(jobs, _run_batches(_translate_multi_throttled, jobs, workers)):
+        for lang in langs:
+            got = result.get(lang, {})
+            for k, v in batch.items():
+                if k not in pending[lang]:
+                    continue
+                if k in got:
+                    translated[lang][k] = got[k]
+                else:
+                    fallback[lang][k] = v
+
+    # Per-language fallback for partial responses
+    fallback_jobs = []
+    fallback_langs = []
+    for lang in target_langs:
+        if fallback[lang]:
+            print(f"Falling back to per-language requests for {len(fallback[lang])} {lang} key(s)...")
+            batches = _split_batches(fallback[lang])
+            for n, batch in enumerate(batches):
+                fallback_jobs.append((batch, LANGUAGES[lang], f"{lang} {n + 1}/{len(batches)}"))
+                fallback_langs.append(lang)
+    for lang, translated_batch in zip(fallback_langs, _run_batches(_translate_batch_throttled, fallback_jobs, workers)):
+        translated[lang].update(translated_batch)
 
-def process_markdown(target_lang: str, filename: str, force: bool = False):
+    for lang in target_langs:
+        if pending[lang]:
+            write_flat_target(lang, translated[lang], dry_run)
+
+def process_markdown(target_lang: str, filename: str, force: bool = False, dry_run: bool = False):
     target_lang_name = LANGUAGES[target_lang]
     source_file = os.path.join(BASE_PATH, "en", filename)
     target_file = os.path.join(BASE_PATH, target_lang, filename)
@@ -227,45 +512,76 @@ def process_markdown(target_lang: str, filename: str, force: bool = False):
     with open(source_file, 'r', encoding='utf-8') as f:
         content = f.read()
     translated = translate_markdown(content, target_lang_name)
+    if dry_run:
+        print(f"Dry run: not writing {target_file}.")
+        return
     os.makedirs(os.path.dirname(target_file), exist_ok=True)
     with open(target_file, 'w', encoding='utf-8') as f:
         f.write(translated)
 
 def main():
+    start = time.perf_counter()
     parser = argparse.ArgumentParser(description="Translate NMS Optimizer files using Gemini AI.")
     parser.add_argument("--lang", help="Specific language code (e.g. es). Default: all supported.")
     parser.add_argument("--files", nargs="+", help="One or more filenames to translate (e.g. about.md translation.json).")
     parser.add_argument("--force", action="store_true", help="Force refresh even if already translated.")
+    parser.add_argument("--provider", choices=sorted(PROVIDERS), default="gemini", help="Translation backend. 'stub' echoes input offline and implies --dry-run.")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="Simulated per-call latency in seconds for the stub provider.")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent JSON batches per language (default: 1).")
+    parser.add_argument("--dry-run", action="store_true", help="Translate but don't write any files.")
+    parser.add_argument("--fanout", action="store_true", help="Translate translation.json for all target languages together, sending each English batch once.")
     args = parser.parse_args()
 
-    if not os.environ.get("GOOGLE_API_KEY"):
+    provider_cls = PROVIDERS[args.provider]
+    if provider_cls.requires_api_key and not os.environ.get("GOOGLE_API_KEY"):
         print("Error: GOOGLE_API_KEY environment variable not set.")
         return
 
+    if provider_cls is StubProvider:
+        set_provider(StubProvider(latency=args.stub_latency))
+    else:
+        set_provider(provider_cls())
+    provider = get_provider()
+    dry_run = args.dry_run or provider_cls is StubProvider
+    deferred = " (SDK import and client creation deferred to first call, reported with the totals)" if provider.deferred_setup else ""
+    print(f"Provider '{provider.name}' constructed in {(time.perf_counter() - start) * 1000:.1f}ms{deferred}")
+
     target_langs = [args.lang] if args.lang else list(LANGUAGES.keys())
     
-    for lang in target_langs:
-        print(f"\n--- Processing {lang} ({LANGUAGES[lang]}) ---")
-        
-        # If specific files are requested, process only those
-        if args.files:
-            for filename in args.files:
-                # Handle potential path prefixes if passed from git diff
-                clean_name = os.path.basename(filename)
-                if clean_name.endswith(".json"):
-                    process_json(lang, args.force)
-                elif clean_name.endswith(".md"):
-                    if clean_name == "changelog.md":
-                        print("Skipping changelog.md (always English).")
-                        continue
-                    process_markdown(lang, clean_name, args.force)
-        else:
-            # Default: Process everything (respecting work preservation logic)
-            process_json(lang, args.force)
-            en_dir = os.path.join(BASE_PATH, "en")
-            for filename in os.listdir(en_dir):
-                if filename.endswith(".md") and filename != "changelog.md":
-                    process_markdown(lang, filename, args.force)
+    files = [os.path.basename(f) for f in args.files] if args.files else None
+    wants_json = files is None or any(f.endswith(".json") for f in files)
+
+    try:
+        if args.fanout and wants_json:
+            print(f"\n--- Processing translation.json ({', '.join(target_langs)}) ---")
+            process_json_fanout(target_langs, args.force, args.workers, dry_run)
+
+        for lang in target_langs:
+            print(f"\n--- Processing {lang} ({LANGUAGES[lang]}) ---")
+            
+            # If specific files are requested, process only those
+            if files:
+                for clean_name in files:
+                    # Paths passed from git diff have been reduced to basenames above
+                    if clean_name.endswith(".json"):
+                        if not args.fanout:
+                            process_json(lang, args.force, args.workers, dry_run)
+                    elif clean_name.endswith(".md"):
+                        if clean_name == "changelog.md":
+                            print("Skipping changelog.md (always English).")
+                            continue
+                        process_markdown(lang, clean_name, args.force, dry_run)
+            else:
+                # Default: Process everything (respecting work preservation logic)
+                if not args.fanout:
+                    process_json(lang, args.force, args.workers, dry_run)
+                en_dir = os.path.join(BASE_PATH, "en")
+                for filename in os.listdir(en_dir):
+                    if filename.endswith(".md") and filename != "changelog.md":
+                        process_markdown(lang, filename, args.force, dry_run)
+    finally:
+        print(f"\n{provider.stats()} | wall {time.perf_counter() - start:.2f}s")
+        provider.close()
 
 if __name__ == "__main__":
     main()